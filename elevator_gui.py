@@ -1,11 +1,47 @@
+import queue
+import threading
 import time as time
 import tkinter as tk
+from collections.abc import Mapping
+from tkinter import font as tkfont
 from tkinter import simpledialog
-from typing import Dict
+from typing import Callable, Dict
 
 from src.core.floor import DefaultFloor
 from src.core.lift import Lift
 
+try:
+    from PIL import Image, ImageDraw, ImageTk
+except ImportError:  # Pillow is optional; the canvas draws the shapes itself
+    Image = ImageDraw = ImageTk = None
+
+# Delay between rendered frames; 16 ms caps redraws at roughly 60 FPS
+FRAME_INTERVAL_MS = 16
+
+# Most simulation events applied per frame, so a burst cannot stall the GUI
+MAX_EVENTS_PER_FRAME = 256
+
+# Tcl lambda run through `apply`: executes every command of a list of commands,
+# so a frame's canvas updates cost one Python -> Tcl call. The commands are
+# passed as Tcl lists, so no text ever needs to be quoted by hand.
+TCL_RUN_BATCH = "{commands} {foreach command $commands {{*}$command}}"
+
+# Colors shared by every drawing call
+COLOR_CANVAS = "#EAEAEA"
+COLOR_BUILDING_OUTLINE = "#333"
+COLOR_BUILDING_FILL = "#F0F0F0"
+COLOR_FLOOR_LINE = "#BBB"
+COLOR_FLOOR_FILL = "#FFFFFF"
+COLOR_FLOOR_LABEL = "#333"
+COLOR_WAITING_TEXT = "#444"
+COLOR_SHAFT_OUTLINE = "#555"
+COLOR_SHAFT_FILL = "#E0E0E0"
+COLOR_CAR_OUTLINE = "#444"
+COLOR_CAR_FILL = "#777"
+COLOR_CAR_PANEL = "#999"
+COLOR_CAR_TEXT = "#FFF"
+COLOR_HEADING = "#222"
+
 
 class Elevator:
     """Represents a visual elevator object that mirrors a Lift object's state.
@@ -26,13 +62,141 @@ class Elevator:
         self.position = lift.current_floor
         self.people_on_elevator = lift.lift_queue.check_size()
 
-    def update_people(self) -> None:
-        """Updates the count of people in the elevator from the lift queue."""
-        self.people_on_elevator = self.lift.lift_queue.check_size()
+    def update_people(self) -> int:
+        """Updates the count of people in the elevator from the lift queue.
+
+        Returns:
+            int: Change in the number of passengers since the last update
+        """
+        people_on_elevator = self.lift.lift_queue.check_size()
+        delta = people_on_elevator - self.people_on_elevator
+        self.people_on_elevator = people_on_elevator
+        return delta
+
+    def update_location(self) -> bool:
+        """Updates the elevator's position from the lift's current floor.
+
+        Returns:
+            bool: Whether the elevator changed floor since the last update
+        """
+        position = self.lift.current_floor
+        moved = position != self.position
+        self.position = position
+        return moved
+
+
+class PhotoImageRenderer:
+    """Paints shapes into an off-screen image and shows it as one canvas item.
+
+    Mirrors the `create_rectangle`/`create_line` calls of a tk.Canvas, but the
+    drawing happens in Pillow, so Tk only has to manage and redraw a single
+    image item instead of one item per shape.
+
+    Attributes:
+        canvas (tk.Canvas): Canvas the image is shown on
+        image (Image.Image): Off-screen image being painted
+    """
+
+    def __init__(
+        self, canvas: tk.Canvas, width: int, height: int, background: str
+    ) -> None:
+        """Initializes the renderer with a blank image.
+
+        Args:
+            canvas (tk.Canvas): Canvas the image is shown on
+            width (int): Width of the image in pixels
+            height (int): Height of the image in pixels
+            background (str): Color the image is cleared to
+        """
+        self.canvas = canvas
+        self.image = Image.new("RGB", (width, height), background)
+        self._draw = ImageDraw.Draw(self.image)
+        self._photo = None
+        self._item_id = None
+
+    @staticmethod
+    def available() -> bool:
+        """Returns whether Pillow is installed."""
+        return Image is not None
+
+    def create_rectangle(
+        self, x0, y0, x1, y1, outline: str = "", fill: str = "", width: int = 1
+    ) -> None:
+        """Paints a rectangle; the outline is centred on the edge, as in Tk."""
+        inset = width // 2
+        self._draw.rectangle(
+            (x0 - inset, y0 - inset, x1 + inset, y1 + inset),
+            fill=fill or None,
+            outline=outline or None,
+            width=width if outline else 0,
+        )
+
+    def create_line(self, *points, fill: str = "#000", width: int = 1) -> None:
+        """Paints a polyline through the flat list of x, y points."""
+        self._draw.line(points, fill=fill, width=width, joint="curve")
+
+    def photo(self) -> "ImageTk.PhotoImage":
+        """Converts the current image into a PhotoImage usable by canvas items.
+
+        The renderer keeps a reference to the returned image, since Tk does not
+        hold on to it itself.
+
+        Returns:
+            ImageTk.PhotoImage: Snapshot of the painted image
+        """
+        self._photo = ImageTk.PhotoImage(self.image, master=self.canvas)
+        return self._photo
+
+    def blit(self, x: int = 0, y: int = 0) -> int:
+        """Shows the current image on the canvas.
+
+        The first call creates the image item; later calls swap the image of
+        the existing item.
+
+        Args:
+            x (int): Left edge of the image on the canvas
+            y (int): Top edge of the image on the canvas
+
+        Returns:
+            int: ID of the canvas image item
+        """
+        photo = self.photo()
+        if self._item_id is None:
+            self._item_id = self.canvas.create_image(x, y, image=photo, anchor="nw")
+        else:
+            self.canvas.itemconfigure(self._item_id, image=photo)
+        return self._item_id
+
+
+class _WaitingView(Mapping):
+    """Read-only mapping of floor number to waiting people over a counts list.
+
+    Reads go straight to the list, so the view never has to be rebuilt.
+    """
+
+    def __init__(self, waiting: list, num_floors: int) -> None:
+        """Initializes the view.
+
+        Args:
+            waiting (list): Waiting counts indexed by floor number
+            num_floors (int): Total number of floors in building
+        """
+        self._waiting = waiting
+        self._num_floors = num_floors
+
+    def __getitem__(self, floor_number: int) -> int:
+        in_range = isinstance(floor_number, int) and (
+            1 <= floor_number <= self._num_floors
+        )
+        if not in_range:
+            raise KeyError(floor_number)
+        return self._waiting[floor_number]
+
+    def __iter__(self):
+        return iter(range(1, self._num_floors + 1))
 
-    def update_location(self) -> None:
-        """Updates the elevator's position from the lift's current floor."""
-        self.position = self.lift.current_floor
+    def __len__(self) -> int:
+        return self._num_floors
 
 
 class ElevatorGUI:
@@ -43,10 +207,9 @@ class ElevatorGUI:
         floors (Dict[int, DefaultFloor]): Dictionary of floor objects
         num_floors (int): Total number of floors in building
         elevators (Dict[str, Elevator]): Dictionary of elevator visualization objects
-        people_per_floor (Dict[int, int]): Number of waiting people on each floor
+        people_per_floor (Mapping[int, int]): Number of waiting people on each floor
         canvas (tk.Canvas): Main drawing canvas for visualization
         frame (tk.Frame): Frame containing canvas and scrollbar
-        scrollable_frame (tk.Frame): Inner frame for scrollable content
     """
 
     def __init__(
@@ -70,15 +233,54 @@ class ElevatorGUI:
         self.elevators = {
             lift_name: Elevator(lift) for lift_name, lift in lifts.items()
         }
-        self.people_per_floor = {
-            floor.floor_number: floor.num_waiting() for floor in floors.values()
+        self._display_names = {
+            lift_name: lift.name.capitalize() for lift_name, lift in lifts.items()
         }
+        self._bind_elevator_updates()
+        # Floors and their waiting counts indexed directly by floor number
+        # (index 0 is unused), so per-floor loops are plain range() indexing
+        self._floors_by_number = [None] * (num_floors + 1)
+        self._waiting = [0] * (num_floors + 1)
+        for floor in floors.values():
+            self._floors_by_number[floor.floor_number] = floor
+            self._waiting[floor.floor_number] = floor.num_waiting()
+        self._total_waiting = sum(self._waiting)
+        self._waiting_view = _WaitingView(self._waiting, num_floors)
+        self._total_in_elevators = sum(
+            elevator.people_on_elevator for elevator in self.elevators.values()
+        )
+        self._dirty_floors = set()
+        self._dirty_elevators = set()
+        self._stats_dirty = False
 
         self.create_widgets()
         self.create_control_buttons()
         self.start_time = time.time()
 
-        self.update_display()
+        self._render_scheduled = False
+        self._render_after_id = None
+        self._last_displayed_second = -1
+        self._last_text: Dict[int, str] = {}
+        self._pending_commands = []
+        self._pending_text: Dict[int, str] = {}
+        self._pending_car_floor: Dict[str, int] = {}
+        self._event_queue = queue.Queue()
+
+        # Floors that support listeners report each enqueue/dequeue themselves.
+        # They may be changed from a simulation thread, so the change is queued
+        # and applied on the Tk thread like any other simulation event. Only
+        # the remaining floors are polled by update_people_per_floor.
+        self._polled_floors = []
+        for floor in floors.values():
+            add_listener = getattr(floor, "add_listener", None)
+            if add_listener is not None:
+                add_listener(self._on_floor_listener)
+            else:
+                self._polled_floors.append(floor.floor_number)
+
+        self._build_static_scene()
+        self.render_immediate()
+        self._schedule_render()
 
     def create_widgets(self) -> None:
         """Creates and configures the GUI widgets including canvas and scrollbar."""
@@ -87,18 +289,12 @@ class ElevatorGUI:
         self.frame.pack(fill=tk.BOTH, expand=True)
 
         # Create a canvas for scrolling
-        self.canvas = tk.Canvas(self.frame, bg="#EAEAEA")
+        self.canvas = tk.Canvas(self.frame, bg=COLOR_CANVAS)
         self.scrollbar = tk.Scrollbar(
             self.frame, orient="vertical", command=self.canvas.yview
         )
-        self.scrollable_frame = tk.Frame(self.canvas)
-
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")),
-        )
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        # The scroll region is set once by _build_static_scene
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -110,190 +306,619 @@ class ElevatorGUI:
         )  # Adjust height for bottom space and top space
 
     def update_scroll_region(self) -> None:
-        """Updates the scrollable region of the canvas to match content size."""
+        """Updates the scrollable region of the canvas to match content size.
+
+        Forces a geometry pass, so it is not part of the per-frame refresh.
+        """
         self.canvas.update_idletasks()
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def _bind_elevator_updates(self) -> None:
+        """Caches the bound update methods of every elevator for `refresh_all`.
+
+        Must be called again whenever `elevators` is changed.
+        """
+        self._update_locations = [
+            (lift_name, elevator.update_location)
+            for lift_name, elevator in self.elevators.items()
+        ]
+        self._update_peoples = [
+            (lift_name, elevator.update_people)
+            for lift_name, elevator in self.elevators.items()
+        ]
+
+    def refresh_all(self) -> None:
+        """Updates every elevator's position and passenger count from its lift.
+
+        Only the elevators that actually moved or changed passengers are redrawn.
+        Must be called on the Tk thread; a simulation thread uses `post_event`.
+        """
+        for lift_name, update_location in self._update_locations:
+            if update_location():
+                self._dirty_elevators.add(lift_name)
+        for lift_name, update_people in self._update_peoples:
+            delta = update_people()
+            if delta:
+                self._total_in_elevators += delta
+                self._dirty_elevators.add(lift_name)
+                self._stats_dirty = True
+
     def update_elevator_position(self, lift_name: str) -> None:
         """Updates an elevator's visual position based on its lift data.
 
+        Must be called on the Tk thread; a simulation thread uses `post_event`.
+
         Args:
             lift_name (str): Name/identifier of the elevator to update
         """
-        elevator = self.elevators.get(lift_name)
-        if elevator and elevator.lift:
-            elevator.update_location()
+        if self.elevators[lift_name].update_location():
+            self._dirty_elevators.add(lift_name)
 
     def update_elevator_people(self, lift_name: str) -> None:
         """Updates passenger count display for an elevator.
 
+        Must be called on the Tk thread; a simulation thread uses `post_event`.
+
         Args:
             lift_name (str): Name/identifier of the elevator to update
         """
-        self.elevators[lift_name].update_people()
+        delta = self.elevators[lift_name].update_people()
+        if delta:
+            self._total_in_elevators += delta
+            self._dirty_elevators.add(lift_name)
+            self._stats_dirty = True
+
+    @property
+    def people_per_floor(self) -> Mapping:
+        """Number of waiting people on each floor, keyed by floor number."""
+        return self._waiting_view
+
+    @people_per_floor.setter
+    def people_per_floor(self, counts: Dict[int, int]) -> None:
+        """Replaces the waiting counts; floors missing from `counts` keep theirs.
+
+        Must be called on the Tk thread.
+        """
+        waiting = self._waiting
+        for floor_number, count in counts.items():
+            delta = count - waiting[floor_number]
+            if delta:
+                self._on_floor_change(floor_number, delta)
 
     def update_people_per_floor(self) -> None:
-        """Updates the count of waiting people on each floor."""
-        self.people_per_floor = {
-            floor.floor_number: floor.num_waiting() for floor in self.floors.values()
-        }
+        """Updates the count of waiting people on each floor.
+
+        Floors that report changes through a listener are skipped, so their
+        changes are never counted twice; floors whose count is unchanged are
+        not redrawn. Must be called on the Tk thread.
+        """
+        floors = self._floors_by_number
+        waiting = self._waiting
+        for i in self._polled_floors:
+            delta = floors[i].num_waiting() - waiting[i]
+            if delta:
+                self._on_floor_change(i, delta)
+
+    def _on_floor_change(self, floor_number: int, delta: int) -> None:
+        """Applies a change in the number of people waiting on a floor.
+
+        Args:
+            floor_number (int): Floor whose queue changed
+            delta (int): Change in the number of waiting people
+        """
+        self._waiting[floor_number] += delta
+        self._total_waiting += delta
+        self._dirty_floors.add(floor_number)
+        self._stats_dirty = True
+
+    def _on_floor_listener(self, floor_number: int, delta: int) -> None:
+        """Floor listener callback; queues the change for the Tk thread.
+
+        Args:
+            floor_number (int): Floor whose queue changed
+            delta (int): Change in the number of waiting people
+        """
+        self.post_event("waiting", floor_number, delta)
+
+    def post_event(self, kind: str, *args) -> None:
+        """Reports a simulation change from any thread.
+
+        Events are applied on the Tk thread by the render loop, so a simulation
+        running in a worker thread must use this instead of touching the GUI.
+        Floors with `add_listener` already post their own "waiting" events; a
+        step must not post "waiting" events for such floors as well, or every
+        change would be counted twice.
+
+        Args:
+            kind (str): "move" (lift_name, floor), "people" (lift_name, count)
+                or "waiting" (floor_number, delta)
+            *args: Arguments of the event
+
+        Raises:
+            ValueError: If the event is unknown or refers to a lift or floor
+                that does not exist; raised on the calling thread so a bad
+                event never reaches the render loop
+        """
+        if kind in ("move", "people"):
+            lift_name, value = args
+            if lift_name not in self.elevators:
+                raise ValueError(f"Unknown lift: {lift_name}")
+            if kind == "move" and not 1 <= value <= self.num_floors:
+                raise ValueError(f"Floor out of range: {value}")
+        elif kind == "waiting":
+            floor_number, _ = args
+            if not 1 <= floor_number <= self.num_floors:
+                raise ValueError(f"Floor out of range: {floor_number}")
+        else:
+            raise ValueError(f"Unknown simulation event: {kind}")
+        self._event_queue.put((kind, *args))
+
+    def _drain_events(self) -> None:
+        """Applies up to `MAX_EVENTS_PER_FRAME` queued simulation events.
+
+        Events are validated by `post_event`, so every queued event is valid.
+        """
+        for _ in range(MAX_EVENTS_PER_FRAME):
+            try:
+                kind, *args = self._event_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if kind == "move":
+                lift_name, floor_number = args
+                self.elevators[lift_name].position = floor_number
+                self._dirty_elevators.add(lift_name)
+            elif kind == "people":
+                lift_name, count = args
+                elevator = self.elevators[lift_name]
+                self._total_in_elevators += count - elevator.people_on_elevator
+                elevator.people_on_elevator = count
+                self._dirty_elevators.add(lift_name)
+                self._stats_dirty = True
+            else:
+                self._on_floor_change(*args)
 
     def update_display(self) -> None:
-        """Redraws the entire visualization including building, shafts, and elevators.
+        """Requests a refresh of the visualization on the next frame.
+
+        Kept for callers of the old API; equivalent to `mark_dirty`, so it must
+        be called on the Tk thread.
+        """
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Flags every elevator and the statistics as out of date.
+
+        For callers that changed state without going through the update methods.
+        Any number of calls between two frames are coalesced into a single
+        refresh by `_tick_render`. Must be called on the Tk thread.
+        """
+        self._mark_all_dirty()
+        if not self._render_scheduled:
+            self._schedule_render()
+
+    def render_immediate(self) -> None:
+        """Refreshes the whole display right away, bypassing the frame timer.
+
+        Intended for shutdown and manual events where waiting for the next
+        frame is not wanted. Queued simulation events are applied first, so
+        the frame shows everything posted so far.
+        """
+        self._drain_events()
+        self._mark_all_dirty()
+        self._refresh_dynamic()
+
+    def _mark_all_dirty(self) -> None:
+        """Flags every elevator and the statistics for the next refresh."""
+        self._dirty_elevators.update(self.elevators)
+        self._stats_dirty = True
 
-        Clears and redraws:
-        - Building outline
-        - Elevator shafts
-        - Floor indicators
-        - Elevator positions
-        - Passenger counts
+    def stop_rendering(self) -> None:
+        """Cancels the pending frame; call before destroying the root window.
+
+        A later `mark_dirty` starts the render loop again.
         """
-        self.canvas.delete("all")
+        if self._render_after_id is not None:
+            self.root.after_cancel(self._render_after_id)
+        self._render_after_id = None
+        self._render_scheduled = False
+
+    def _schedule_render(self) -> None:
+        """Schedules the next call of `_tick_render`."""
+        self._render_scheduled = True
+        self._render_after_id = self.root.after(FRAME_INTERVAL_MS, self._tick_render)
+
+    def _tick_render(self) -> None:
+        """Applies queued events and refreshes, then schedules the next frame.
 
+        The next frame is scheduled even if this one raises, so one failing
+        refresh does not stop the display for good.
+        """
+        self._render_scheduled = False
+        self._render_after_id = None
+        try:
+            self._drain_events()
+            self._refresh_dynamic()
+        finally:
+            if not self._render_scheduled:
+                self._schedule_render()
+
+    def _elapsed_seconds(self) -> int:
+        """Returns the whole number of seconds since the GUI started."""
+        return int(time.time() - self.start_time)
+
+    def _time_second_changed(self) -> bool:
+        """Returns whether the elapsed time shown on screen is out of date."""
+        return self._elapsed_seconds() != self._last_displayed_second
+
+    def _build_static_scene(self) -> None:
+        """Draws the building, floors and shafts and creates the dynamic items.
+
+        The building outline, floor rectangles, floor labels, shafts and shaft
+        titles never change, so they are drawn once. The elevator cars, passenger
+        counts and statistics are created here too and their item IDs kept so
+        `_refresh_dynamic` can update them in place.
+        """
         building_width = 300
         building_height = self.num_floors * 80
         building_x = 50
         building_y = 50
 
+        shaft_width = 100
+        spacing = 5
+        shaft_top = building_y
+
+        distance_to_first_elevator = 160
+
+        first_shaft_left = building_x + building_width + distance_to_first_elevator
+        self._shaft_left_by_index = [
+            first_shaft_left + index * (shaft_width + spacing)
+            for index in range(len(self.elevators))
+        ]
+        # x of the outer car edges, inner panel edges and caption per elevator
+        self._car_coords = [
+            (
+                shaft_left,
+                shaft_left + shaft_width,
+                shaft_left + 20,
+                shaft_left + shaft_width - 20,
+                shaft_left + shaft_width / 2,
+            )
+            for shaft_left in self._shaft_left_by_index
+        ]
+        self._floor_y = {
+            i: shaft_top + (self.num_floors - i) * 80  # Adjusted for smoother scaling
+            for i in range(1, self.num_floors + 1)
+        }
+
+        # Font objects are shared by every text item instead of passing a
+        # font tuple that Tk has to parse for each one
+        self._font_label = tkfont.Font(
+            root=self.root, family="Arial", size=14, weight="bold"
+        )
+        self._font_title = tkfont.Font(
+            root=self.root, family="Arial", size=16, weight="bold"
+        )
+        self._font_plain = tkfont.Font(root=self.root, family="Arial", size=14)
+
+        # Paint the static shapes into one image when Pillow is available,
+        # otherwise create them as ordinary canvas items
+        if PhotoImageRenderer.available():
+            painter = PhotoImageRenderer(
+                self.canvas,
+                self._shaft_left_by_index[-1] + shaft_width + 2,
+                shaft_top + building_height + 2,
+                background=self.canvas.cget("bg"),
+            )
+        else:
+            painter = self.canvas
+
         # Draw the building outline with a softer color
-        self.canvas.create_rectangle(
+        painter.create_rectangle(
             building_x,
             building_y,
             building_x + building_width,
             building_y + building_height,
-            outline="#333",
-            fill="#F0F0F0",
+            outline=COLOR_BUILDING_OUTLINE,
+            fill=COLOR_BUILDING_FILL,
             width=2,
         )
 
-        shaft_width = 100
-        spacing = 5
-        shaft_top = building_y
-
-        distance_to_first_elevator = 160
-
-        for index, elevator in enumerate(self.elevators.values()):
-            shaft_left = (
-                building_x
-                + building_width
-                + distance_to_first_elevator
-                + index * (shaft_width + spacing)
+        # Floors do not depend on the elevators, so draw them once: a single
+        # white rectangle plus one polyline zig-zagging across every divider
+        painter.create_rectangle(
+            0,
+            shaft_top,
+            500,
+            shaft_top + building_height,
+            outline=COLOR_FLOOR_LINE,
+            fill=COLOR_FLOOR_FILL,
+            width=2,
+        )
+        divider_points = []
+        for i in range(1, self.num_floors):
+            y = shaft_top + i * 80
+            if i % 2:
+                divider_points.extend((0, y, 500, y))
+            else:
+                divider_points.extend((500, y, 0, y))
+        if len(divider_points) >= 4:
+            painter.create_line(*divider_points, fill=COLOR_FLOOR_LINE, width=2)
+
+        self._elevator_car_ids = {}
+        self._inside_text_ids = {}
+        self._waiting_text_ids = {}
+
+        # Floor pass: label and waiting count for every floor
+        for i in range(1, self.num_floors + 1):
+            y = self._floor_y[i]
+            self.canvas.create_text(
+                50, y + 40, text=f"F{i}", font=self._font_label, fill=COLOR_FLOOR_LABEL
             )
 
+            # Display waiting people on each floor with better text alignment
+            waiting_text = f"Waiting: {self._waiting[i]}"
+            waiting_id = self.canvas.create_text(
+                200,
+                y + 40,
+                text=waiting_text,
+                font=self._font_plain,
+                fill=COLOR_WAITING_TEXT,
+            )
+            self._waiting_text_ids[i] = waiting_id
+            self._last_text[waiting_id] = waiting_text
+
+        self._shaft_title_ids = {}
+        self._car_tags = {}
+        self._car_floor = {}
+
+        # With Pillow, the car body and its panel are pre-rendered into one
+        # sprite shared by every car, so each car is one image plus its caption.
+        # The sprite is 2px larger than the car to fit the centred outline.
+        if PhotoImageRenderer.available():
+            sprite = PhotoImageRenderer(
+                self.canvas, shaft_width + 2, 82, background=COLOR_CAR_FILL
+            )
+            sprite.create_rectangle(
+                1,
+                1,
+                shaft_width,
+                80,
+                outline=COLOR_CAR_OUTLINE,
+                fill=COLOR_CAR_FILL,
+                width=2,
+            )
+            sprite.create_rectangle(21, 21, shaft_width - 20, 60, fill=COLOR_CAR_PANEL)
+            self._car_sprite = sprite.photo()
+        else:
+            self._car_sprite = None
+
+        # Elevator pass: shaft, title and car for every elevator
+        for shaft_left, car_coords, (lift_name, elevator) in zip(
+            self._shaft_left_by_index, self._car_coords, self.elevators.items()
+        ):
             # Draw the elevator shaft with a modern look
-            self.canvas.create_rectangle(
+            painter.create_rectangle(
                 shaft_left,
                 shaft_top,
                 shaft_left + shaft_width,
                 shaft_top + building_height,
-                outline="#555",
-                fill="#E0E0E0",
+                outline=COLOR_SHAFT_OUTLINE,
+                fill=COLOR_SHAFT_FILL,
                 width=2,
             )
-            self.canvas.create_text(
+            # Shaft titles never change, so they are not touched after this
+            self._shaft_title_ids[lift_name] = self.canvas.create_text(
                 shaft_left + shaft_width / 2,
                 shaft_top - 25,
-                text=f"{elevator.lift.name.capitalize()}",
-                font=("Arial", 16, "bold"),
-                fill="#222",
+                text=self._display_names[lift_name],
+                font=self._font_title,
+                fill=COLOR_HEADING,
             )
 
-            for i in self.people_per_floor.keys():
-                y = (
-                    shaft_top + (self.num_floors - i) * 80
-                )  # Adjusted for smoother scaling
-
-                # Draw floor rectangles with a light gray color
-                self.canvas.create_rectangle(
-                    0, y, 500, y + 80, outline="#BBB", fill="#FFFFFF", width=2
+            # Create the elevator car; all its items share one tag so
+            # _refresh_dynamic can move them together with a single call
+            outer_x0, outer_x1, inner_x0, inner_x1, text_x = car_coords
+            car_tag = f"car_{lift_name}"
+            car_floor = self._display_floor(elevator.position)
+            y = self._floor_y[car_floor]
+            if self._car_sprite is not None:
+                sprite_id = self.canvas.create_image(
+                    outer_x0 - 1,
+                    y - 1,
+                    image=self._car_sprite,
+                    anchor="nw",
+                    tags=(car_tag,),
                 )
-                self.canvas.create_text(
-                    50, y + 40, text=f"F{i}", font=("Arial", 14, "bold"), fill="#333"
+                self._elevator_car_ids[lift_name] = (sprite_id,)
+            else:
+                outer_id = self.canvas.create_rectangle(
+                    outer_x0,
+                    y,
+                    outer_x1,
+                    y + 80,
+                    outline=COLOR_CAR_OUTLINE,
+                    fill=COLOR_CAR_FILL,
+                    width=2,
+                    tags=(car_tag,),
                 )
-
-                # Draw the elevator at its current position with a gradient effect
-                if i == elevator.position:
-                    self.canvas.create_rectangle(
-                        shaft_left,
-                        y,
-                        shaft_left + shaft_width,
-                        y + 80,
-                        outline="#444",
-                        fill="#777",
-                        width=2,
-                    )
-                    self.canvas.create_rectangle(
-                        shaft_left + 20,
-                        y + 20,
-                        shaft_left + shaft_width - 20,
-                        y + 60,
-                        fill="#999",
-                        outline="",
-                    )
-
-                    inside_people_text = f"Inside: {elevator.people_on_elevator}"
-                    self.canvas.create_text(
-                        shaft_left + shaft_width / 2,
-                        y + 60,
-                        text=inside_people_text,
-                        font=("Arial", 14),
-                        fill="#FFF",
-                    )
-
-                # Display waiting people on each floor with better text alignment
-                waiting_people_text = f"Waiting: {self.people_per_floor[i]}"
-                self.canvas.create_text(
-                    200,
-                    y + 40,
-                    text=waiting_people_text,
-                    font=("Arial", 14),
-                    fill="#444",
+                inner_id = self.canvas.create_rectangle(
+                    inner_x0,
+                    y + 20,
+                    inner_x1,
+                    y + 60,
+                    fill=COLOR_CAR_PANEL,
+                    outline="",
+                    tags=(car_tag,),
                 )
-
-        stats_x = shaft_left + shaft_width + 250
+                self._elevator_car_ids[lift_name] = (outer_id, inner_id)
+            inside_text = f"Inside: {elevator.people_on_elevator}"
+            inside_id = self.canvas.create_text(
+                text_x,
+                y + 60,
+                text=inside_text,
+                font=self._font_plain,
+                fill=COLOR_CAR_TEXT,
+                tags=(car_tag,),
+            )
+            self._inside_text_ids[lift_name] = inside_id
+            self._last_text[inside_id] = inside_text
+            self._car_tags[lift_name] = car_tag
+            self._car_floor[lift_name] = car_floor
+
+        if painter is not self.canvas:
+            # Keep the painted background underneath the text and cars. The
+            # renderer is kept on self: it owns the only reference to the
+            # PhotoImage, and Tk deletes the image once that is collected.
+            self._static_layer = painter
+            self._static_layer_id = painter.blit()
+            self.canvas.tag_lower(self._static_layer_id)
+        else:
+            self._static_layer = None
+            self._static_layer_id = None
+
+        stats_x = self._shaft_left_by_index[-1] + shaft_width + 250
         stats_y = shaft_top + 50
-        total_people_waiting = sum(self.people_per_floor.values())
-        total_people_in_elevators = sum(
-            elevator.people_on_elevator for elevator in self.elevators.values()
-        )
-        total_people = total_people_waiting + total_people_in_elevators
-
-        self.canvas.create_text(
-            stats_x,
-            stats_y,
-            text=f"Total Waiting on Floors: {total_people_waiting}",
-            font=("Arial", 14, "bold"),
-            fill="#222",
-        )
 
-        self.canvas.create_text(
-            stats_x,
-            stats_y + 30,
-            text=f"Total In Elevators: {total_people_in_elevators}",
-            font=("Arial", 14, "bold"),
-            fill="#222",
+        # Total waiting, total in elevators, total people and elapsed time
+        self._stats_ids = tuple(
+            self.canvas.create_text(
+                stats_x,
+                stats_y + offset,
+                text="",
+                font=self._font_label,
+                fill=COLOR_HEADING,
+            )
+            for offset in (0, 30, 60, 90)
         )
 
-        self.canvas.create_text(
-            stats_x,
-            stats_y + 60,
-            text=f"Total People: {total_people}",
-            font=("Arial", 14, "bold"),
-            fill="#222",
-        )
-        elapsed_time = time.time() - self.start_time
-        minutes = int(elapsed_time // 60)
-        seconds = int(elapsed_time % 60)
-        elapsed_time_text = f"Elapsed Time: {minutes}m {seconds}s"
-        self.canvas.create_text(
-            stats_x,
-            stats_y + 90,
-            text=elapsed_time_text,
-            font=("Arial", 14, "bold"),
-            fill="#222",
+        # The content extent is fixed once the scene is built, so the scroll
+        # region is set here rather than measured on every frame
+        self.canvas.configure(
+            scrollregion=(0, 0, stats_x + 400, 50 + self.num_floors * 85 + 100)
         )
 
-        self.update_scroll_region()
+    def _refresh_dynamic(self) -> None:
+        """Moves the elevator cars and updates passenger counts and statistics.
+
+        Existing canvas items are moved with `move` and their text changed with
+        `_set_text`; nothing is deleted or recreated. The changes are queued and
+        sent to Tcl together at the end. Only the floors, elevators and
+        statistics flagged as dirty are visited; if nothing is, this returns
+        without doing any work.
+        """
+        time_changed = self._time_second_changed()
+        if not (
+            self._dirty_floors
+            or self._dirty_elevators
+            or self._stats_dirty
+            or time_changed
+        ):
+            return
+
+        # Entries are popped before they are drawn, so one that fails is not
+        # retried on every frame and does not block the rest of the refresh
+        dirty_floors = self._dirty_floors
+        while dirty_floors:
+            i = dirty_floors.pop()
+            self._set_text(self._waiting_text_ids[i], f"Waiting: {self._waiting[i]}")
+
+        dirty_elevators = self._dirty_elevators
+        while dirty_elevators:
+            lift_name = dirty_elevators.pop()
+            elevator = self.elevators[lift_name]
+            old_floor = self._pending_car_floor.get(
+                lift_name, self._car_floor[lift_name]
+            )
+            new_floor = self._display_floor(elevator.position)
+            if new_floor != old_floor:
+                # One call shifts the car body, panel and caption together;
+                # the floor is only recorded once the move has been sent
+                dy = self._floor_y[new_floor] - self._floor_y[old_floor]
+                self._queue_command("move", self._car_tags[lift_name], 0, dy)
+                self._pending_car_floor[lift_name] = new_floor
+
+            self._set_text(
+                self._inside_text_ids[lift_name],
+                f"Inside: {elevator.people_on_elevator}",
+            )
+
+        waiting_id, in_elevators_id, total_id, elapsed_id = self._stats_ids
+
+        if self._stats_dirty:
+            total_people_waiting = self._total_waiting
+            total_people_in_elevators = self._total_in_elevators
+            total_people = total_people_waiting + total_people_in_elevators
+            self._set_text(
+                waiting_id, f"Total Waiting on Floors: {total_people_waiting}"
+            )
+            self._set_text(
+                in_elevators_id, f"Total In Elevators: {total_people_in_elevators}"
+            )
+            self._set_text(total_id, f"Total People: {total_people}")
+            self._stats_dirty = False
+
+        # The elapsed time is only shown to the second
+        if time_changed:
+            elapsed_seconds = self._elapsed_seconds()
+            minutes, seconds = divmod(elapsed_seconds, 60)
+            self._set_text(elapsed_id, f"Elapsed Time: {minutes}m {seconds}s")
+            self._last_displayed_second = elapsed_seconds
+
+        self._flush_commands()
+
+    def _queue_command(self, *args) -> None:
+        """Queues a canvas widget command to be sent with `_flush_commands`.
+
+        Args:
+            *args: Canvas subcommand and its arguments, e.g. "move", tag, 0, dy
+        """
+        self._pending_commands.append((str(self.canvas), *args))
+
+    def _flush_commands(self) -> None:
+        """Sends all queued canvas commands to Tcl in a single call.
+
+        The queue is emptied even if Tcl raises, so a failing batch is not
+        resent every frame; text and car floors are only remembered as shown
+        once they were sent.
+        """
+        commands = self._pending_commands
+        if not commands:
+            return
+        try:
+            if len(commands) == 1:
+                self.canvas.tk.call(*commands[0])
+            else:
+                self.canvas.tk.call("apply", TCL_RUN_BATCH, tuple(commands))
+            self._last_text.update(self._pending_text)
+            self._car_floor.update(self._pending_car_floor)
+        finally:
+            commands.clear()
+            self._pending_text.clear()
+            self._pending_car_floor.clear()
+
+    def _display_floor(self, position: int) -> int:
+        """Clamps a lift position to a floor that exists in the drawing.
+
+        Args:
+            position (int): Floor reported by the lift
+
+        Returns:
+            int: The nearest floor between 1 and `num_floors`
+        """
+        return min(max(position, 1), self.num_floors)
+
+    def _set_text(self, item_id: int, text: str) -> None:
+        """Queues a text change for a canvas item unless it is already shown.
+
+        Args:
+            item_id (int): ID of the canvas text item
+            text (str): Text to display
+        """
+        shown = self._pending_text.get(item_id, self._last_text.get(item_id))
+        if shown != text:
+            self._queue_command("itemconfigure", item_id, "-text", text)
+            self._pending_text[item_id] = text
 
     def create_control_buttons(self) -> None:
         """Creates control buttons for manual elevator control.
@@ -314,6 +939,39 @@ class ElevatorGUI:
         #     down_button.pack(side=tk.LEFT)
 
 
+class SimulationWorker(threading.Thread):
+    """Runs the simulation step in a background thread at a fixed interval.
+
+    The step must not touch Tk; it reports changes with `ElevatorGUI.post_event`
+    and the GUI applies them on its own thread.
+
+    Attributes:
+        step (Callable[[], None]): Advances the simulation by one tick
+        interval (float): Seconds between two steps
+    """
+
+    def __init__(self, step: Callable[[], None], interval: float) -> None:
+        """Initializes the worker; call `start` to begin stepping.
+
+        Args:
+            step (Callable[[], None]): Advances the simulation by one tick
+            interval (float): Seconds between two steps
+        """
+        super().__init__(daemon=True)
+        self.step = step
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Calls `step` every `interval` seconds until `stop` is called."""
+        while not self._stop_event.wait(self.interval):
+            self.step()
+
+    def stop(self) -> None:
+        """Asks the worker to finish after the current step."""
+        self._stop_event.set()
+
+
 class ElevatorController:
     def __init__(self, elevators, gui):
         self.elevators = elevators
@@ -324,8 +982,10 @@ class ElevatorController:
         """Calls the move_up method on the specified elevator and updates the display."""
         if 0 <= elevator_index < len(self.elevators):
             elevator_name = self.elevator_names[elevator_index]
-            self.elevators[elevator_name].move_up()
-            self.gui.update_display()  # Update the GUI after moving the elevator
+            lift = self.elevators[elevator_name]
+            lift.move_up()
+            # Queued so this is safe from a simulation thread too
+            self.gui.post_event("move", elevator_name, lift.current_floor)
             return True
         return False
 
@@ -333,8 +993,10 @@ class ElevatorController:
         """Calls the move_down method on the specified elevator and updates the display."""
         if 0 <= elevator_index < len(self.elevators):
             elevator_name = self.elevator_names[elevator_index]
-            self.elevators[elevator_name].move_down()
-            self.gui.update_display()  # Update the GUI after moving the elevator
+            lift = self.elevators[elevator_name]
+            lift.move_down()
+            # Queued so this is safe from a simulation thread too
+            self.gui.post_event("move", elevator_name, lift.current_floor)
             return True
         return False
 